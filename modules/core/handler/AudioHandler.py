@@ -1,8 +1,11 @@
 import base64
 import io
+import queue
+import threading
 from typing import AsyncGenerator, Generator
 
 import numpy as np
+import torch
 from fastapi import Request
 from fastapi.responses import StreamingResponse
 
@@ -86,9 +89,45 @@ class AudioHandler:
 
     def enqueue_to_stream(self) -> Generator[bytes, None, None]:
         encoder = self.get_encoder()
+
+        # NOTE: 生成(GPU)和编码(CPU/ffmpeg)重叠：生产者线程跑推理往队列放 chunk，
+        #       当前线程喂 encoder 并吐编码结果，encoder 反压不会卡住生成
+        chunk_queue: queue.Queue = queue.Queue(maxsize=4)
+        done = object()
+        # 消费端提前退出（比如客户端断开）时置位，唤醒阻塞在 put 上的生产者
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    chunk_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                with torch.inference_mode():
+                    for chunk in self.enqueue_stream():
+                        if not put(chunk):
+                            return
+                put(done)
+            except Exception as e:
+                put(e)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
         try:
             chunk_data = bytes()
-            for sample_rate, audio_data in self.enqueue_stream():
+            while True:
+                item = chunk_queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                sample_rate, audio_data = item
                 encoder.set_header(sample_rate=sample_rate)
                 audio_bytes = read_np_to_wav(audio_data=audio_data)
                 encoder.write(audio_bytes)
@@ -104,6 +143,7 @@ class AudioHandler:
                 yield chunk_data
                 chunk_data = encoder.read()
         finally:
+            stop.set()
             encoder.terminate()
 
     def interrupt(self):
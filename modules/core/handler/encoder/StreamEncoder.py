@@ -9,6 +9,58 @@ import pydub
 import pydub.utils
 
 
+# 预热进程池
+# NOTE: ffmpeg 管道是一次性的（close 关闭 stdin 即冲洗并退出），没法复位复用，
+#       所以这里按参数预先 spawn 好进程，open 时直接取用并在后台补充，
+#       省掉请求路径上的进程启动 + codec 初始化（短文本合成时很明显）
+_warm_pool: dict[tuple, queue.Queue] = {}
+_WARM_POOL_SIZE = 2
+
+
+def _spawn_encoder_process(
+    encoder: str, format: str, acodec: str, bitrate: str
+) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            encoder,
+            "-threads",
+            "4",
+            "-f",
+            "wav",
+            "-i",
+            "pipe:0",
+            "-f",
+            format,
+            "-acodec",
+            acodec,
+            "-b:a",
+            bitrate,
+            "-",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+def _refill_warm_pool(encoder: str, format: str, acodec: str, bitrate: str):
+    pool = _warm_pool.setdefault(
+        (format, acodec, bitrate), queue.Queue(maxsize=_WARM_POOL_SIZE)
+    )
+
+    def fill():
+        if pool.full():
+            return
+        p = _spawn_encoder_process(encoder, format, acodec, bitrate)
+        try:
+            pool.put_nowait(p)
+        except queue.Full:
+            # 并发 refill 竞态下队列被填满，别让这个活进程变孤儿
+            p.terminate()
+
+    threading.Thread(target=fill, daemon=True).start()
+
+
 def wave_header_chunk(frame_input=b"", channels=1, sample_width=2, sample_rate=24000):
     wav_buf = io.BytesIO()
     with wave.open(wav_buf, "wb") as vfout:
@@ -45,27 +97,17 @@ class StreamEncoder:
         self, format: str = "mp3", acodec: str = "libmp3lame", bitrate: str = "320k"
     ):
         encoder = self.encoder
-        self.p = subprocess.Popen(
-            [
-                encoder,
-                "-threads",
-                "4",
-                "-f",
-                "wav",
-                "-i",
-                "pipe:0",
-                "-f",
-                format,
-                "-acodec",
-                acodec,
-                "-b:a",
-                bitrate,
-                "-",
-            ],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        pool = _warm_pool.setdefault(
+            (format, acodec, bitrate), queue.Queue(maxsize=_WARM_POOL_SIZE)
         )
+        try:
+            self.p = pool.get_nowait()
+            if self.p.poll() is not None:
+                # 预热进程意外退出，回退到现场 spawn
+                self.p = _spawn_encoder_process(encoder, format, acodec, bitrate)
+        except queue.Empty:
+            self.p = _spawn_encoder_process(encoder, format, acodec, bitrate)
+        _refill_warm_pool(encoder, format, acodec, bitrate)
         self.read_thread = threading.Thread(target=self._read_output)
         self.read_thread.daemon = True
         self.read_thread.start()
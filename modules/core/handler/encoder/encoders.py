@@ -2,38 +2,43 @@ from modules.core.handler.encoder.StreamEncoder import StreamEncoder
 
 
 class Mp3Encoder(StreamEncoder):
+    CONTAINER = "mp3"
+    DEFAULT_ACODEC = "libmp3lame"
 
-    def open(self, acodec: str = "libmp3lame", bitrate: str = "128k"):
-        acodec = acodec or "libmp3lame"
-        return super().open("mp3", acodec, bitrate)
+    def open(self, acodec: str = None, bitrate: str = "128k"):
+        return super().open(self.CONTAINER, acodec or self.DEFAULT_ACODEC, bitrate)
 
 
 class WavEncoder(StreamEncoder):
+    CONTAINER = "wav"
+    DEFAULT_ACODEC = "pcm_s16le"
 
-    def open(self, acodec: str = "pcm_s16le", bitrate: str = "128k"):
-        acodec = acodec or "pcm_s16le"
-        return super().open("wav", acodec, bitrate)
+    def open(self, acodec: str = None, bitrate: str = "128k"):
+        return super().open(self.CONTAINER, acodec or self.DEFAULT_ACODEC, bitrate)
 
 
 class OggEncoder(StreamEncoder):
+    CONTAINER = "ogg"
+    DEFAULT_ACODEC = "libvorbis"
 
-    def open(self, acodec: str = "libvorbis", bitrate: str = "128k"):
-        acodec = acodec or "libvorbis"
-        return super().open("ogg", acodec, bitrate)
+    def open(self, acodec: str = None, bitrate: str = "128k"):
+        return super().open(self.CONTAINER, acodec or self.DEFAULT_ACODEC, bitrate)
 
 
 class FlacEncoder(StreamEncoder):
+    CONTAINER = "flac"
+    DEFAULT_ACODEC = "flac"
 
-    def open(self, acodec: str = "flac", bitrate: str = "128k"):
-        acodec = acodec or "flac"
-        return super().open("flac", acodec, bitrate)
+    def open(self, acodec: str = None, bitrate: str = "128k"):
+        return super().open(self.CONTAINER, acodec or self.DEFAULT_ACODEC, bitrate)
 
 
 class AacEncoder(StreamEncoder):
+    CONTAINER = "aac"
+    DEFAULT_ACODEC = "aac"
 
-    def open(self, acodec: str = "aac", bitrate: str = "128k"):
-        acodec = acodec or "acc"
-        return super().open("aac", acodec, bitrate)
+    def open(self, acodec: str = None, bitrate: str = "128k"):
+        return super().open(self.CONTAINER, acodec or self.DEFAULT_ACODEC, bitrate)
 
 
 class RawEncoder(StreamEncoder):
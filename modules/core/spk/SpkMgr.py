@@ -14,8 +14,10 @@ class SpeakerManager(FolderDatabase):
     def __init__(self):
         super().__init__("./data/speakers/")
 
+    SPK_FILE_EXTS = (".spkv1.json", ".spkv1.png")
+
     def is_valid_file(self, file_path: str) -> bool:
-        return file_path.endswith(".spkv1.json") or file_path.endswith(".spkv1.png")
+        return file_path.endswith(self.SPK_FILE_EXTS)
 
     def load_item(self, file_path: str) -> Union[TTSSpeaker, None]:
         if file_path.endswith(".spkv1.json"):
@@ -3,6 +3,7 @@ import copy
 import dataclasses
 import json
 import uuid
+from functools import cached_property
 from tempfile import _TemporaryFileWrapper
 from typing import Any, Callable, Optional, Union
 
@@ -126,6 +127,23 @@ class TTSSpeaker:
         else:
             raise ValueError(f"unsupported file type: {path}")
 
+    @staticmethod
+    def read_header(path: str) -> DcSpkMeta:
+        """
+        只读取 speaker 文件的 meta 信息
+        不经过 DcSpkDecoder，token/参考音频等大字段不会被 base64 解码
+        """
+        if path.endswith(".json"):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            meta = data.get("data", {}).get("meta", {}).get("data", {})
+            fields = {f.name for f in dataclasses.fields(DcSpkMeta)}
+            return DcSpkMeta(**{k: v for k, v in meta.items() if k in fields})
+        elif path.endswith(".png"):
+            raise NotImplementedError("read speaker header from png not implemented")
+        else:
+            raise ValueError(f"unsupported file type: {path}")
+
     @staticmethod
     def from_token(model_id: str, tokens: list) -> "TTSSpeaker":
         spk = TTSSpeaker.empty()
@@ -222,9 +240,11 @@ class TTSSpeaker:
 
     def set_name(self, name: str) -> None:
         self._data.meta.name = name
+        self.__dict__.pop("display_name", None)
 
     def set_gender(self, gender: str) -> None:
         self._data.meta.gender = gender
+        self.__dict__.pop("display_name", None)
 
     def set_author(self, author: str) -> None:
         self._data.meta.author = author
@@ -276,6 +296,15 @@ class TTSSpeaker:
     def gender(self) -> str:
         return self._data.meta.gender
 
+    @cached_property
+    def display_name(self) -> str:
+        """
+        ui 展示用的名字，缓存在实例上，set_name/set_gender 时失效
+        """
+        if self.gender == "*" or self.gender == "":
+            return self.name
+        return f"{self.gender} : {self.name}"
+
     @property
     def author(self) -> str:
         return self._data.meta.author
@@ -101,13 +101,26 @@ class TNPipeline:
         return result
 
     def normalize(self, text: str, config: Optional[TNConfig] = None) -> str:
+        blocks = self._enabled_blocks(config)
+        return self._normalize_text(text, blocks)
+
+    def normalize_batch(
+        self, texts: list[str], config: Optional[TNConfig] = None
+    ) -> list[str]:
+        """
+        批量归一化，block 启停配置只解析一次，适合 spliter 之类逐句调用的场景
+        """
+        blocks = self._enabled_blocks(config)
+        return [self._normalize_text(text, blocks) for text in texts]
+
+    def _normalize_text(self, text: str, blocks: list[TNBlock]) -> str:
         texts: list[TNText] = self.split_string_with_freeze(text, self.freeze_tokens)
 
         result = ""
 
         for tn_text in texts:
             if tn_text.type == "normal":
-                result += self._normalize(tn_text.text, config)
+                result += self._normalize(tn_text.text, blocks)
             else:
                 result += tn_text.text
             result += self.SEP_CHAR
@@ -127,14 +140,13 @@ class TNPipeline:
         guess = GuessLang(zh_or_en=zh_or_en, detected=detected)
         return guess
 
-    def _normalize(self, text: str, config: Optional[TNConfig] = TNConfig()):
+    def _enabled_blocks(self, config: Optional[TNConfig] = None) -> list[TNBlock]:
         if config is None:
             config = TNConfig()
         enabled_block = config.enabled if config.enabled else []
         disabled_block = config.disabled if config.disabled else []
 
-        guess = self.guess_langs(text)
-
+        blocks: list[TNBlock] = []
         for block in self.blocks:
             enabled = block.enabled
 
@@ -143,8 +155,14 @@ class TNPipeline:
             if block.name in disabled_block:
                 enabled = False
 
-            if not enabled:
-                continue
+            if enabled:
+                blocks.append(block)
+        return blocks
+
+    def _normalize(self, text: str, blocks: list[TNBlock]):
+        guess = self.guess_langs(text)
+
+        for block in blocks:
             # print(text)
             # print("---", block.name)
             text = block.process(text=text, guess_lang=guess)
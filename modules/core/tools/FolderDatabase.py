@@ -10,12 +10,15 @@ class FolderDatabase:
     def __init__(self, base_dir: str):
         self.base_dir = base_dir
         self.items: Dict[str, Any] = {}
+        # 每次 refresh 自增，供外部缓存判断 items 是否变化
+        self.version = 0
         self.refresh()
 
     def filepath(self, filename: str) -> str:
         return os.path.join(self.base_dir, filename)
 
     def refresh(self):
+        self.version += 1
         self.items = {}
         for root, _, files in os.walk(self.base_dir):
             for file in files:
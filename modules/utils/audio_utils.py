@@ -31,7 +31,10 @@ def audio_to_int16(audio_data: np.ndarray) -> np.ndarray:
         or audio_data.dtype == np.float128
         or audio_data.dtype == np.float16
     ):
-        audio_data = (audio_data * INT16_MAX).astype(np.int16)
+        # NOTE: 单次遍历完成 缩放+clip+cast，避免多次申请中间 buffer
+        audio_data = np.multiply(audio_data, INT16_MAX, dtype=np.float32)
+        np.clip(audio_data, np.iinfo(np.int16).min, INT16_MAX, out=audio_data)
+        audio_data = audio_data.astype(np.int16, copy=False)
     return audio_data
 
 
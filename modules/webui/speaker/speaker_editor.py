@@ -102,7 +102,7 @@ def speaker_editor_ui():
         with gr.Column(scale=2):
             with gr.Group():
                 gr.Markdown("💼Speaker file")
-                spk_file = gr.File(label="*.json file", file_types=SPK_FILE_EXTS)
+                spk_file = gr.File(label="*.json file", file_types=list(SPK_FILE_EXTS))
                 spk_info = gr.Markdown("None")
 
                 spk_file.change(
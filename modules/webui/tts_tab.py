@@ -107,7 +107,7 @@ class TTSInterface:
 
                 with gr.Tab(label="Upload"):
                     spk_file_upload = gr.File(
-                        label="Speaker (Upload)", file_types=SPK_FILE_EXTS
+                        label="Speaker (Upload)", file_types=list(SPK_FILE_EXTS)
                     )
                     gr.Markdown("📝Speaker info")
                     infos = gr.Markdown("empty", elem_classes=["no-translate"])
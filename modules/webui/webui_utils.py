@@ -1,10 +1,10 @@
 import logging
+from functools import lru_cache
 from typing import Optional, Union
 
 import gradio as gr
 import numpy as np
 import torch
-import torch.profiler
 
 from modules import refiner
 from modules.api.utils import calc_spk_style
@@ -20,7 +20,7 @@ from modules.core.handler.SSMLHandler import SSMLHandler
 from modules.core.handler.TTSHandler import TTSHandler
 from modules.core.handler.datacls.vc_model import VCConfig
 from modules.core.models.tts import ChatTtsModel
-from modules.core.spk import TTSSpeaker, spk_mgr
+from modules.core.spk import spk_mgr
 from modules.core.spk.TTSSpeaker import TTSSpeaker
 from modules.core.ssml.SSMLParser import SSMLBreak, SSMLSegment, create_ssml_v01_parser
 from modules.core.tn import ChatTtsTN
@@ -34,12 +34,30 @@ import time
 
 logger = logging.getLogger(__name__)
 
-SPK_FILE_EXTS = [
+# NOTE: tuple 可以直接喂给 str.endswith
+SPK_FILE_EXTS = (
     # ".spkv1.json",
     # ".spkv1.png",
     ".json",
     ".png",
-]
+)
+
+
+def auto_batch_size(requested: int, text_len: int) -> int:
+    """
+    按当前空闲显存收缩 batch_size，GPU 被占用时避免 OOM
+    没有 cuda 时原样返回
+    """
+    if not torch.cuda.is_available():
+        return requested
+    try:
+        free, _total = torch.cuda.mem_get_info()
+    except RuntimeError:
+        return requested
+    # 经验值：每个 batch 样本大约 text_len MB 的激活/缓存开销
+    est_bytes_per_sample = max(text_len, 1) * (1 << 20)
+    max_batch = max(1, int(free // est_bytes_per_sample))
+    return max(1, min(requested, max_batch))
 
 
 def get_speakers(filter: Optional[callable] = None) -> list[TTSSpeaker]:
@@ -50,36 +68,49 @@ def get_speakers(filter: Optional[callable] = None) -> list[TTSSpeaker]:
     return spks
 
 
-def get_speaker_names(
-    filter: Optional[callable] = None,
+@lru_cache(maxsize=8)
+def _get_speaker_names_cached(
+    version: int, filter: Optional[callable] = None
 ) -> tuple[list[TTSSpeaker], list[str]]:
     speakers = get_speakers(filter)
 
-    def get_speaker_show_name(spk: TTSSpeaker):
-        if spk.gender == "*" or spk.gender == "":
-            return spk.name
-        return f"{spk.gender} : {spk.name}"
-
-    speaker_names = [get_speaker_show_name(speaker) for speaker in speakers]
-    speaker_names.sort(key=lambda x: x.startswith("*") and "-1" or x)
+    speaker_names = [speaker.display_name for speaker in speakers]
+    # NOTE: "*" 开头的（内置）排最前面；key 只算一次，而不是每次比较都跑 startswith
+    keys = ["\x00" if name.startswith("*") else name for name in speaker_names]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    speaker_names = [speaker_names[i] for i in order]
+    speakers = [speakers[i] for i in order]
 
     return speakers, speaker_names
 
 
+def get_speaker_names(
+    filter: Optional[callable] = None,
+) -> tuple[list[TTSSpeaker], list[str]]:
+    # NOTE: spk_mgr.version 在 refresh 时自增，speaker 增删后缓存自动失效
+    return _get_speaker_names_cached(spk_mgr.version, filter)
+
+
 def get_styles():
     return styles_mgr.list_items()
 
 
+@lru_cache(maxsize=1)
+def get_ssml_parser():
+    # NOTE: parser 本身无状态（parse 每次新建 segments），可以整个进程复用一个
+    return create_ssml_v01_parser()
+
+
 def load_spk_info(file):
     if file is None:
         return "empty"
     try:
-
-        spk: TTSSpeaker = TTSSpeaker.from_file(file)
+        # NOTE: 只展示 meta，不需要把 token/参考音频整个反序列化出来
+        meta = TTSSpeaker.read_header(file)
         return f"""
-- name: {spk.name}
-- gender: {spk.gender}
-- describe: {spk.desc}
+- name: {meta.name}
+- gender: {meta.gender}
+- describe: {meta.desc}
     """.strip()
     except Exception as e:
         logger.error(f"load spk info failed: {e}")
@@ -89,17 +120,16 @@ def load_spk_info(file):
 def segments_length_limit(
     segments: list[Union[SSMLBreak, SSMLSegment]], total_max: int
 ) -> list[Union[SSMLBreak, SSMLSegment]]:
-    ret_segments = []
-    total_len = 0
-    for seg in segments:
-        if isinstance(seg, SSMLBreak):
-            ret_segments.append(seg)
-            continue
-        total_len += len(seg["text"])
-        if total_len > total_max:
-            break
-        ret_segments.append(seg)
-    return ret_segments
+    if len(segments) == 0:
+        return []
+    # NOTE: SSMLBreak 记 0 长度，用前缀和在 C 里找截断点，免得在 python 里逐个累加
+    lens = np.fromiter(
+        (0 if isinstance(seg, SSMLBreak) else len(seg["text"]) for seg in segments),
+        dtype=np.int64,
+        count=len(segments),
+    )
+    cut = int(np.searchsorted(np.cumsum(lens), total_max, side="right"))
+    return segments[:cut]
 
 
 @torch.inference_mode()
@@ -128,7 +158,7 @@ def synthesize_ssml(
     if ssml == "":
         raise gr.Error("SSML is empty, please input some SSML")
 
-    parser = create_ssml_v01_parser()
+    parser = get_ssml_parser()
     segments = parser.parse(ssml)
     max_len = webui_config.ssml_max
     segments = segments_length_limit(segments, max_len)
@@ -136,6 +166,9 @@ def synthesize_ssml(
     if len(segments) == 0:
         raise gr.Error("No valid segments in SSML")
 
+    # 文本会按 spliter_thr 切块，所以单样本长度按 spliter_thr 估算
+    batch_size = auto_batch_size(batch_size, text_len=spliter_thr)
+
     infer_config = InferConfig(
         batch_size=batch_size,
         spliter_threshold=spliter_thr,
@@ -174,9 +207,11 @@ def synthesize_ssml(
     sample_rate, audio_data = handler.enqueue()
 
     # NOTE: 这里必须要加，不然 gradio 没法解析成 mp3 格式
-    audio_data = audio_utils.audio_to_int16(audio_data)
+    audio_i16 = audio_utils.audio_to_int16(audio_data)
+    # 尽早释放 float32 buffer，长音频时少占一份波形的内存
+    del audio_data
 
-    return sample_rate, audio_data
+    return sample_rate, audio_i16
 
 
 # @torch.inference_mode()
@@ -221,6 +256,10 @@ def tts_generate(
     if text == "":
         raise gr.Error("Text is empty, please input some text")
 
+    # NOTE: 校验放在最前面，坏请求不用白跑 style/speaker/wav 编码那一堆
+    if ref_audio is not None and (ref_audio_text is None or ref_audio_text.strip() == ""):
+        raise gr.Error("ref_audio_text is empty")
+
     if style == "*auto":
         style = ""
 
@@ -228,24 +267,35 @@ def tts_generate(
         top_k = int(top_k)
 
     params = calc_spk_style(spk=spk, style=style)
-    spk = params.get("spk", spk)
-
-    infer_seed = infer_seed or params.get("seed", infer_seed)
-    temperature = temperature or params.get("temperature", temperature)
-    prefix = prefix or params.get("prefix", "")
-    prompt = params.get("prompt", "")
-    prompt1 = prompt1 or params.get("prompt1", "")
-    prompt2 = prompt2 or params.get("prompt2", "")
 
-    infer_seed = np.clip(infer_seed, -1, 2**32 - 1, out=None, dtype=np.float64)
-    infer_seed = int(infer_seed)
+    # NOTE: 非默认（truthy）的用户入参覆盖 style 带来的参数，一次 merge 代替逐项 or 判断
+    overrides = {
+        "seed": infer_seed,
+        "temperature": temperature,
+        "prefix": prefix,
+        "prompt1": prompt1,
+        "prompt2": prompt2,
+    }
+    merged = {**params, **{k: v for k, v in overrides.items() if v}}
+
+    spk = merged.get("spk", spk)
+    infer_seed = merged.get("seed", infer_seed)
+    temperature = merged.get("temperature", temperature)
+    prefix = merged.get("prefix", "")
+    prompt = merged.get("prompt", "")
+    prompt1 = merged.get("prompt1", "")
+    prompt2 = merged.get("prompt2", "")
+
+    # NOTE: 纯标量 clamp，没必要走 np.clip
+    infer_seed = max(-1, min(int(infer_seed), 2**32 - 1))
 
     # ref: https://github.com/2noise/ChatTTS/issues/123#issue-2326908144
     min_n = 0.000000001
     if temperature == 0.1:
         temperature = min_n
 
-    if isinstance(spk, int):
+    if isinstance(spk, int) and not spk_file and ref_audio is None:
+        # NOTE: spk_file / ref_audio 会覆盖 spk，这时跳过 seed 造 speaker
         spk = ChatTtsModel.ChatTTSModel.create_speaker_from_seed(spk)
 
     if spk_file:
@@ -255,8 +305,6 @@ def tts_generate(
             raise gr.Error("Failed to load speaker file")
 
     if ref_audio is not None:
-        if ref_audio_text is None or ref_audio_text.strip() == "":
-            raise gr.Error("ref_audio_text is empty")
         ref_audio_bytes = encode_to_wav(audio_tuple=ref_audio)
         spk = TTSSpeaker.from_ref_wav_bytes(
             ref_wav=ref_audio_bytes,
@@ -274,6 +322,9 @@ def tts_generate(
         prompt1=prompt1,
         prompt2=prompt2,
     )
+    # 文本会按 spliter_thr 切块，所以单样本长度按 spliter_thr 估算
+    batch_size = auto_batch_size(batch_size, text_len=min(len(text), spliter_thr))
+
     infer_config = InferConfig(
         batch_size=batch_size,
         spliter_threshold=spliter_thr,
@@ -298,7 +349,16 @@ def tts_generate(
         bitrate="64k",
     )
 
-    print(f"Start Generate Audio\n TTSConfig: {tts_config}\n InferConfig: {infer_config}\n AdjustConfig: {adjust_config}\n EnhancerConfig: {enhancer_config}\n EncoderConfig: {encoder_config}\n Text:{text}\n")
+    # NOTE: %-格式是惰性的，DEBUG 关闭时不会触发各 config 的 repr
+    logger.debug(
+        "Start generate audio\n TTSConfig: %s\n InferConfig: %s\n AdjustConfig: %s\n EnhancerConfig: %s\n EncoderConfig: %s\n Text: %r",
+        tts_config,
+        infer_config,
+        adjust_config,
+        enhancer_config,
+        encoder_config,
+        text,
+    )
     start_time = time.perf_counter()
 
     handler = TTSHandler(
@@ -315,18 +375,30 @@ def tts_generate(
     sample_rate, audio_data = handler.enqueue()
 
     end_time = time.perf_counter()
-    print(f"TTS Elapsed Time: {round(end_time - start_time, 2)}s")
+    logger.info("TTS elapsed %.2fs", end_time - start_time)
 
     # NOTE: 这里必须要加，不然 gradio 没法解析成 mp3 格式
-    audio_data = audio_utils.audio_to_int16(audio_data)
-    return sample_rate, audio_data
+    audio_i16 = audio_utils.audio_to_int16(audio_data)
+    # 尽早释放 float32 buffer，长音频时少占一份波形的内存
+    del audio_data
+    return sample_rate, audio_i16
+
+
+# NOTE: 只读共享，省掉每次调用的 pydantic 模型构造
+_DEFAULT_TN_CONFIG = TNConfig(disabled=["replace_unk_tokens"])
+
+# pipeline 实例在 import 时绑定一次，热路径上少走两层属性查找
+_chat_tts_tn = ChatTtsTN.ChatTtsTN
 
 
 @torch.inference_mode()
 def text_normalize(text: str) -> str:
-    return ChatTtsTN.ChatTtsTN.normalize(
-        text, config=TNConfig(disabled=["replace_unk_tokens"])
-    )
+    return _chat_tts_tn.normalize(text, config=_DEFAULT_TN_CONFIG)
+
+
+@torch.inference_mode()
+def text_normalize_batch(texts: list[str]) -> list[str]:
+    return _chat_tts_tn.normalize_batch(texts, config=_DEFAULT_TN_CONFIG)
 
 
 @torch.inference_mode()
@@ -356,13 +428,19 @@ def refine_text(
     )
 
 
+@lru_cache(maxsize=8)
+def get_sentence_spliter(threshold: int) -> SentenceSplitter:
+    # NOTE: spliter 自身无状态（parse 不改成员），按 threshold 复用即可
+    return SentenceSplitter(threshold=threshold)
+
+
 @torch.inference_mode()
 @spaces.GPU(duration=120)
 def split_long_text(long_text_input, spliter_threshold=100, eos=""):
     # TODO 传入 tokenizer
-    spliter = SentenceSplitter(threshold=spliter_threshold)
+    spliter = get_sentence_spliter(spliter_threshold)
     sentences = spliter.parse(long_text_input)
-    sentences = [text_normalize(s) + eos for s in sentences]
+    sentences = [s + eos for s in text_normalize_batch(sentences)]
     data = []
     for i, text in enumerate(sentences):
         token_length = spliter.len(text)
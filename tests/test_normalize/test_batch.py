@@ -0,0 +1,38 @@
+import pytest
+
+from modules.core.handler.datacls.tn_model import TNConfig
+from modules.core.tn import ChatTtsTN
+
+ChatTtsTN.ChatTtsTN.remove_block("replace_unk_tokens")
+
+
+@pytest.mark.parametrize(
+    "input_texts",
+    [
+        # 空列表
+        [],
+        # 单句
+        ["我有102块钱"],
+        # 中英混合多句
+        [
+            "项目完成了 80%",
+            "他在1984年出生",
+            "Hello, world! How are you?",
+            "温度降到了-10度 [uv_break] 价格是3.5元",
+        ],
+    ],
+)
+@pytest.mark.normalize
+def test_text_normalize_batch(input_texts):
+    pipeline = ChatTtsTN.ChatTtsTN
+    expected = [pipeline.normalize(text) for text in input_texts]
+    assert pipeline.normalize_batch(input_texts) == expected
+
+
+@pytest.mark.normalize
+def test_text_normalize_batch_with_config():
+    pipeline = ChatTtsTN.ChatTtsTN
+    config = TNConfig(disabled=["apply_character_map"])
+    input_texts = ["他拿到了 2/3 的票数！", "通过率达到了 95%"]
+    expected = [pipeline.normalize(text, config=config) for text in input_texts]
+    assert pipeline.normalize_batch(input_texts, config=config) == expected